@@ -60,11 +60,11 @@ def run(args):
             logger.warning("Module parsing not implemented; skipping .mod specific contents")
             continue
         elif p.suffix.lower() in [".erf", ".hak"]:
-            total_files += _process_erf(manifest, p)
+            total_files += _process_erf(repo, manifest, p)
         elif p.is_dir():
-            total_files += _process_directory(manifest, p)
+            total_files += _process_directory(repo, manifest, p)
         else:
-            total_files += _process_single_file(manifest, p)
+            total_files += _process_single_file(repo, manifest, p)
 
     if args.dry_run:
         _print_manifest_summary(manifest)
@@ -98,12 +98,12 @@ def run(args):
         return 1
 
 
-def _process_erf(manifest: Manifest, erf_path: Path) -> int:
+def _process_erf(repo: NWSyncRepository, manifest: Manifest, erf_path: Path) -> int:
     try:
         erf = read_erf(str(erf_path))
         added = 0
         for entry in erf.list_entries():
-            sha1 = hashlib.sha1(entry.data).hexdigest()
+            sha1 = repo.sha1_for_blob(entry.data)
             manifest.add_entry(ManifestEntry(entry.resref, entry.res_type, sha1, len(entry.data)))
             added += 1
         return added
@@ -112,18 +112,18 @@ def _process_erf(manifest: Manifest, erf_path: Path) -> int:
         return 0
 
 
-def _process_directory(manifest: Manifest, dir_path: Path) -> int:
+def _process_directory(repo: NWSyncRepository, manifest: Manifest, dir_path: Path) -> int:
     added = 0
     for fp in dir_path.rglob("*"):
         if fp.is_file():
-            added += _process_single_file(manifest, fp)
+            added += _process_single_file(repo, manifest, fp)
     return added
 
 
-def _process_single_file(manifest: Manifest, file_path: Path) -> int:
+def _process_single_file(repo: NWSyncRepository, manifest: Manifest, file_path: Path) -> int:
     try:
         data = file_path.read_bytes()
-        sha1 = hashlib.sha1(data).hexdigest()
+        sha1 = repo.sha1_for_blob(data)
         # Infer resref and type from filename.ext
         name = file_path.stem
         ext = file_path.suffix[1:].lower()
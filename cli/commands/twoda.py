@@ -148,7 +148,7 @@ def csv_to_twoda(input_csv: Path) -> Tuple[List[str], List[Dict[str, Any]]]:
         except Exception:
             pass
         values = r[1:] + [""] * max(0, len(columns) - (len(r) - 1))
-        row_dict: Dict[str, Any]] = {"Row": row_id}  # type: ignore
+        row_dict: Dict[str, Any] = {"Row": row_id}
         for c, v in zip(columns, values):
             row_dict[c] = None if v == "" else v
         data_rows.append(row_dict)
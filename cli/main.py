@@ -72,13 +72,6 @@ def main():
         help='Prune NWSync repository'
     ))
     
-    # ERF commands
-    erf_pack_parser = subparsers.add_parser('erf-pack', help='Pack ERF archives')
-    erf_pack.setup_parser(erf_pack_parser)
-    
-    erf_unpack_parser = subparsers.add_parser('erf-unpack', help='Unpack ERF archives')
-    erf_unpack.setup_parser(erf_unpack_parser)
-    
     # GFF commands
     gff_parser = subparsers.add_parser('gff', help='Convert GFF files')
     gff.setup_parser(gff_parser)
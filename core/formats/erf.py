@@ -92,7 +92,11 @@ class Erf:
 
 class ErfReader:
     """ERF file reader"""
-    
+
+    # Precompiled record layouts for bulk table parsing
+    _KEY = struct.Struct('<16sLL')
+    _RESOURCE = struct.Struct('<LL')
+
     def __init__(self, stream: BinaryIO):
         self.stream = stream
         
@@ -116,11 +120,9 @@ class ErfReader:
         logger.debug(f"ERF Header: {file_type} {version_str}, "
                     f"{entry_count} entries, {loc_string_count} localized strings")
         
-        # Skip remaining header padding
-        if version == ErfVersion.V1:
-            self.stream.read(116)  # Reserved space
-        else:  # E1
-            self.stream.read(92)   # Different padding for enhanced
+        # Skip remaining header padding; seek avoids allocating a throwaway
+        # bytes object for the reserved space on every open
+        self.stream.seek(116 if version == ErfVersion.V1 else 92, io.SEEK_CUR)
             
         # Read localized strings
         if loc_string_count > 0:
@@ -160,99 +162,106 @@ class ErfReader:
     def _read_key_list(self, offset: int, count: int) -> List[Dict]:
         """Read key list"""
         self.stream.seek(offset)
+        buf = self.stream.read(count * 24)
         keys = []
-        for _ in range(count):
-            resref = self.stream.read(16).rstrip(b'\x00').decode('ascii')
-            res_id, res_type = struct.unpack('<LL', self.stream.read(8))
+        for resref_raw, res_id, res_type in self._KEY.iter_unpack(buf):
             keys.append({
-                'resref': resref,
+                'resref': resref_raw.rstrip(b'\x00').decode('ascii'),
                 'res_id': res_id,
                 'res_type': res_type
             })
         return keys
-        
+
     def _read_resource_list(self, offset: int, count: int) -> List[Dict]:
         """Read resource list"""
         self.stream.seek(offset)
-        resources = []
-        for _ in range(count):
-            res_offset, res_size = struct.unpack('<LL', self.stream.read(8))
-            resources.append({
-                'offset': res_offset,
-                'size': res_size
-            })
-        return resources
+        buf = self.stream.read(count * 8)
+        return [{'offset': res_offset, 'size': res_size}
+                for res_offset, res_size in self._RESOURCE.iter_unpack(buf)]
 
 
 class ErfWriter:
     """ERF file writer"""
-    
+
+    # Precompiled record layouts for the single-buffer table write
+    _HEADER = struct.Struct('<4s4sLLLLLLLLLL')
+    _LOC_STRING = struct.Struct('<LL')
+    _KEY = struct.Struct('<16sLL')
+    _RESOURCE = struct.Struct('<LL')
+
     def __init__(self, stream: BinaryIO):
         self.stream = stream
-        
+
     def write(self, erf: Erf):
         """Write ERF to stream"""
         entries = list(erf.entries.values())
         entries.sort(key=lambda e: e.resref)  # Sort for reproducible builds
-        
+
         # Calculate offsets
         header_size = 160  # Fixed header size
-        loc_string_size = sum(len(s.encode('utf-8')) + 8 for s in erf.localized_strings.values())
+        loc_strings = [(lang_id, s.encode('utf-8'))
+                       for lang_id, s in erf.localized_strings.items()]
+        loc_string_size = sum(len(b) + 8 for _, b in loc_strings)
         key_list_size = len(entries) * 24  # 16 + 4 + 4 per entry
         resource_list_size = len(entries) * 8  # 4 + 4 per entry
-        
+
         offset_to_loc_strings = header_size
         offset_to_key_list = offset_to_loc_strings + loc_string_size
         offset_to_resource_list = offset_to_key_list + key_list_size
         data_offset = offset_to_resource_list + resource_list_size
-        
-        # Write header
-        self.stream.write(erf.file_type.ljust(4)[:4].encode('ascii'))
-        self.stream.write(erf.version.value.encode('ascii'))
-        
-        # Write header fields
-        header_data = struct.pack('<LLLLLLLLLL',
+
+        # Pack header and all tables into one preallocated buffer so the
+        # whole fixed-size prefix goes out in a single stream.write call
+        # instead of several small writes per entry. Header padding is
+        # implicit: the bytearray is zero-initialized.
+        buf = bytearray(data_offset)
+        gmt = time.gmtime()
+        self._HEADER.pack_into(buf, 0,
+            erf.file_type.ljust(4)[:4].encode('ascii'),
+            erf.version.value.encode('ascii'),
             len(erf.localized_strings),    # loc_string_count
             loc_string_size,               # loc_string_size
             len(entries),                  # entry_count
             offset_to_loc_strings,         # offset_to_loc_strings
             offset_to_key_list,           # offset_to_key_list
             offset_to_resource_list,      # offset_to_resource_list
-            time.gmtime().tm_year - 1900, # build_year
-            time.gmtime().tm_yday,        # build_day
+            gmt.tm_year - 1900,           # build_year
+            gmt.tm_yday,                  # build_day
             erf.description_str_ref,      # description_str_ref
             0                             # reserved
         )
-        self.stream.write(header_data)
-        
-        # Write padding based on version
-        if erf.version == ErfVersion.V1:
-            self.stream.write(b'\x00' * 116)
-        else:  # E1
-            self.stream.write(b'\x00' * 92)
-            
-        # Write localized strings
-        for lang_id, string in erf.localized_strings.items():
-            string_bytes = string.encode('utf-8')
-            self.stream.write(struct.pack('<LL', lang_id, len(string_bytes)))
-            self.stream.write(string_bytes)
-            
-        # Write key list
+
+        # Localized strings
+        pos = offset_to_loc_strings
+        for lang_id, string_bytes in loc_strings:
+            self._LOC_STRING.pack_into(buf, pos, lang_id, len(string_bytes))
+            pos += 8
+            buf[pos:pos + len(string_bytes)] = string_bytes
+            pos += len(string_bytes)
+
+        # Key list
+        pos = offset_to_key_list
         for entry in entries:
-            resref_bytes = entry.resref.encode('ascii')[:16].ljust(16, b'\x00')
-            self.stream.write(resref_bytes)
-            self.stream.write(struct.pack('<LL', 0, entry.res_type))  # res_id=0
-            
-        # Write resource list and calculate data offsets
+            self._KEY.pack_into(buf, pos,
+                                entry.resref.encode('ascii')[:16],
+                                0,              # res_id
+                                entry.res_type)
+            pos += 24
+
+        # Resource list with data offsets
+        pos = offset_to_resource_list
         current_data_offset = data_offset
         for entry in entries:
-            self.stream.write(struct.pack('<LL', current_data_offset, len(entry.data)))
+            self._RESOURCE.pack_into(buf, pos, current_data_offset, len(entry.data))
+            pos += 8
             current_data_offset += len(entry.data)
-            
+
+        self.stream.write(buf)
+
         # Write actual data
         for entry in entries:
             self.stream.write(entry.data)
-            
+
         logger.info(f"Wrote ERF with {len(entries)} entries")
 
 
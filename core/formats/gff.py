@@ -123,7 +123,10 @@ class GffRoot(GffStruct):
 
 class GffReader:
     """GFF file reader"""
-    
+
+    # Precompiled record layout shared by struct and field tables
+    _RECORD = struct.Struct('<LLL')
+
     def __init__(self, stream: io.IOBase):
         self.stream = stream
         
@@ -157,29 +160,25 @@ class GffReader:
     def _read_structs(self, offset: int, count: int) -> List:
         """Read structure entries"""
         self.stream.seek(offset)
-        structs = []
-        for _ in range(count):
-            struct_data = struct.unpack('<LLL', self.stream.read(12))
-            structs.append(struct_data)
-        return structs
-        
+        buf = self.stream.read(count * 12)
+        return list(self._RECORD.iter_unpack(buf))
+
     def _read_fields(self, offset: int, count: int) -> List:
         """Read field entries"""
         self.stream.seek(offset)
-        fields = []
-        for _ in range(count):
-            field_data = struct.unpack('<LLL', self.stream.read(12))
-            fields.append(field_data)
-        return fields
-        
+        buf = self.stream.read(count * 12)
+        return list(self._RECORD.iter_unpack(buf))
+
     def _read_labels(self, offset: int, count: int) -> List[str]:
         """Read label strings"""
         self.stream.seek(offset)
-        labels = []
-        for _ in range(count):
-            label = self.stream.read(16).rstrip(b'\x00').decode('ascii')
-            labels.append(label)
-        return labels
+        buf = self.stream.read(count * 16)
+        # Decode the whole label block once; per-label work is then pure
+        # C-level string slicing instead of count decode calls. Strict
+        # decode keeps the validation semantics: a bad byte raises
+        # UnicodeDecodeError exactly as the per-label decode did.
+        text = buf.decode('ascii')
+        return [text[i:i + 16].rstrip('\x00') for i in range(0, count * 16, 16)]
         
     def _build_structure(self, root: GffRoot, structs, fields, labels, field_data_offset):
         """Build the complete structure hierarchy"""
@@ -13,12 +13,26 @@ from typing import Dict, List, Optional, BinaryIO
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 
 class ManifestEntry:
     """Single entry in a NWSync manifest"""
-    
+
+    # Manifests can hold hundreds of thousands of entries; slots drop the
+    # per-instance __dict__ overhead
+    __slots__ = ('resref', 'res_type', 'sha1', 'size')
+
     def __init__(self, resref: str, res_type: int, sha1: str, size: int):
         self.resref = resref
         self.res_type = res_type
@@ -91,31 +105,68 @@ class NWSyncRepository:
         self.manifests_path.mkdir(parents=True, exist_ok=True)
         self.data_path.mkdir(parents=True, exist_ok=True)
         
+        # Lazily opened connection for blob hash lookups during ingest
+        self._blob_conn: Optional[sqlite3.Connection] = None
+
         # Initialize database if needed
         self._init_database()
-        
+
     def _init_database(self):
         """Initialize the metadata database"""
-        if not self.meta_db_path.exists():
-            conn = sqlite3.connect(str(self.meta_db_path))
-            conn.execute('''
-                CREATE TABLE manifests (
-                    sha1 TEXT PRIMARY KEY,
-                    created INTEGER,
-                    version INTEGER,
-                    name TEXT,
-                    description TEXT,
-                    group_id INTEGER
-                )
-            ''')
-            conn.execute('''
-                CREATE TABLE shards (
-                    id INTEGER PRIMARY KEY,
-                    serial TEXT
-                )
-            ''')
-            conn.commit()
-            conn.close()
+        conn = sqlite3.connect(str(self.meta_db_path))
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS manifests (
+                sha1 TEXT PRIMARY KEY,
+                created INTEGER,
+                version INTEGER,
+                name TEXT,
+                description TEXT,
+                group_id INTEGER
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS shards (
+                id INTEGER PRIMARY KEY,
+                serial TEXT
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS blobs (
+                size INTEGER,
+                xxh3 BLOB,
+                sha1 TEXT,
+                PRIMARY KEY (size, xxh3)
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def sha1_for_blob(self, data: bytes) -> str:
+        """SHA1 of a resource blob, via an xxh3 prefilter cache.
+
+        Identical blobs recur across re-ingests (shared haks, repeated
+        modules). When xxhash is available, key previously seen blobs by
+        (size, xxh3_128) in the metadata database and reuse the stored
+        SHA1, skipping the slower SHA1 pass entirely on cache hits.
+        """
+        if xxhash is None:
+            return hashlib.sha1(data).hexdigest()
+
+        xxh = xxhash.xxh3_128(data).digest()
+        if self._blob_conn is None:
+            self._blob_conn = sqlite3.connect(str(self.meta_db_path))
+        row = self._blob_conn.execute(
+            'SELECT sha1 FROM blobs WHERE size = ? AND xxh3 = ?',
+            (len(data), xxh)).fetchone()
+        if row:
+            return row[0]
+
+        sha1 = hashlib.sha1(data).hexdigest()
+        self._blob_conn.execute(
+            'INSERT OR REPLACE INTO blobs (size, xxh3, sha1) VALUES (?, ?, ?)',
+            (len(data), xxh, sha1))
+        self._blob_conn.commit()
+        return sha1
             
     def write_manifest(self, manifest: Manifest, limit_file_size: int = 32) -> str:
         """Write a manifest to the repository"""
@@ -163,8 +214,15 @@ class NWSyncRepository:
             "group_id": manifest.group_id
         }
         
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            # orjson encodes indented output far faster than stdlib json;
+            # sorted keys keep the metadata reproducible.
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
             
     def _update_database(self, manifest: Manifest):
         """Update metadata database"""
@@ -203,77 +261,67 @@ class NWSyncRepository:
 
 class ManifestWriter:
     """Binary manifest writer"""
-    
+
+    _HEADER = struct.Struct('<4sII')
+    _ENTRY = struct.Struct('<16sI20sI')
+
     def __init__(self, stream: BinaryIO):
         self.stream = stream
-        
+
     def write(self, manifest: Manifest):
         """Write binary manifest"""
-        # Magic header
-        self.stream.write(b'NWSM')  # NWSync Manifest
-        
-        # Version
-        self.stream.write(struct.pack('<I', manifest.version))
-        
-        # Entry count
-        self.stream.write(struct.pack('<I', len(manifest.entries)))
-        
-        # Write entries
-        for entry in sorted(manifest.entries):
-            # ResRef (16 bytes, null-padded)
-            resref_bytes = entry.resref.encode('ascii')[:16].ljust(16, b'\x00')
-            self.stream.write(resref_bytes)
-            
-            # Resource type
-            self.stream.write(struct.pack('<I', entry.res_type))
-            
-            # SHA1 (as bytes)
-            sha1_bytes = bytes.fromhex(entry.sha1)
-            self.stream.write(sha1_bytes)
-            
-            # Size
-            self.stream.write(struct.pack('<I', entry.size))
+        entries = sorted(manifest.entries)
+
+        # Pack header plus the whole entry table into one buffer and write
+        # it once, instead of four small writes per entry
+        buf = bytearray(self._HEADER.size + len(entries) * self._ENTRY.size)
+        self._HEADER.pack_into(buf, 0, b'NWSM', manifest.version, len(entries))
+
+        pos = self._HEADER.size
+        for entry in entries:
+            self._ENTRY.pack_into(buf, pos,
+                                  entry.resref.encode('ascii')[:16],
+                                  entry.res_type,
+                                  bytes.fromhex(entry.sha1),
+                                  entry.size)
+            pos += self._ENTRY.size
+
+        self.stream.write(buf)
 
 
 class ManifestReader:
     """Binary manifest reader"""
-    
+
+    # Precompiled entry layout: resref, res_type, sha1, size
+    _ENTRY = struct.Struct('<16sI20sI')
+
     def __init__(self, stream: BinaryIO):
         self.stream = stream
-        
+
     def read(self) -> Manifest:
         """Read binary manifest"""
         manifest = Manifest()
-        
+
         # Check magic
         magic = self.stream.read(4)
         if magic != b'NWSM':
             raise ValueError("Invalid manifest magic")
-            
-        # Version
-        manifest.version = struct.unpack('<I', self.stream.read(4))[0]
-        
-        # Entry count
-        entry_count = struct.unpack('<I', self.stream.read(4))[0]
-        
-        # Read entries
-        for _ in range(entry_count):
-            # ResRef
-            resref = self.stream.read(16).rstrip(b'\x00').decode('ascii')
-            
-            # Resource type
-            res_type = struct.unpack('<I', self.stream.read(4))[0]
-            
-            # SHA1
-            sha1_bytes = self.stream.read(20)
-            sha1 = sha1_bytes.hex()
-            
-            # Size
-            size = struct.unpack('<I', self.stream.read(4))[0]
-            
-            entry = ManifestEntry(resref, res_type, sha1, size)
-            manifest.add_entry(entry)
-            
+
+        # Version and entry count
+        manifest.version, entry_count = struct.unpack('<II', self.stream.read(8))
+
+        # Read the whole entry table at once and parse with a precompiled
+        # struct; avoids four stream reads and format re-parses per entry.
+        buf = self.stream.read(entry_count * self._ENTRY.size)
+        entries = manifest.entries
+        for resref_raw, res_type, sha1_bytes, size in self._ENTRY.iter_unpack(buf):
+            entries.append(ManifestEntry(
+                resref_raw.rstrip(b'\x00').decode('ascii'),
+                res_type,
+                sha1_bytes.hex(),
+                size
+            ))
+
         return manifest
 
 
@@ -3,54 +3,82 @@ Resource Manager implementation
 Based on neverwinter.nim resman functionality
 """
 
+import concurrent.futures
+import fnmatch
+import mmap
 import os
+import queue
+import re
+import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Union, BinaryIO
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, BinaryIO
 from abc import ABC, abstractmethod
 import logging
 
 from .formats import Erf, read_erf
 from .nwsync import NWSyncRepository, read_manifest
+from .utils import EXT_TO_RESTYPE
 
 logger = logging.getLogger(__name__)
 
 
+def _static_prefix(pattern: str) -> Optional[str]:
+    """Literal lowercase prefix of a pattern, up to the first metacharacter.
+
+    Used to pre-filter container listings before the full regex/glob match;
+    conservative for both syntaxes since it stops at any metacharacter of
+    either.
+    """
+    for i, ch in enumerate(pattern):
+        if ch in '*?[].^$+{}()|\\':
+            return pattern[:i].lower() or None
+    return pattern.lower() or None
+
+
+def _anchored_prefix(pattern: str) -> Optional[str]:
+    """Literal lowercase prefix of a ^-anchored regex, else None.
+
+    Search semantics match anywhere in the name, so only a pattern
+    anchored at the start can be safely pre-filtered by prefix.
+    """
+    if not pattern.startswith('^'):
+        return None
+    return _static_prefix(pattern[1:])
+
+
 class ResRef:
     """Resource reference (filename + type)"""
-    
+
+    # ResRefs are allocated in bulk during cache builds and probed as dict
+    # keys on every lookup; slots plus a precomputed hash avoid the
+    # per-instance __dict__ and the tuple allocation per hash call
+    __slots__ = ('name', 'res_type', '_hash')
+
     def __init__(self, name: str, res_type: int):
         self.name = name.lower()  # Case insensitive
         self.res_type = res_type
-        
+        self._hash = hash((self.name, res_type))
+
     def __str__(self):
         return f"{self.name}.{self.res_type}"
-        
+
     def __eq__(self, other):
         if not isinstance(other, ResRef):
             return False
         return self.name == other.name and self.res_type == other.res_type
-        
+
     def __hash__(self):
-        return hash((self.name, self.res_type))
+        return self._hash
         
     @classmethod
     def from_filename(cls, filename: str, default_type: int = 0):
         """Create ResRef from filename"""
-        if '.' in filename:
-            name, ext = filename.rsplit('.', 1)
-            # Map common extensions to types (simplified)
-            ext_map = {
-                'are': 2012, 'gic': 2013, 'git': 2014, 'gff': 2021,
-                'fac': 2022, 'ifo': 2023, 'bic': 2025, 'dlg': 2029,
-                'itp': 2030, 'bmp': 1, 'dds': 1, 'tga': 3, 'wav': 4,
-                'plt': 6, 'ini': 7, 'txt': 10, 'mdl': 2002, 'nss': 2009,
-                'ncs': 2010, 'utc': 2027, 'utd': 2028, 'ute': 2032,
-                'uti': 2033, 'utm': 2035, 'utp': 2042, 'uts': 2043,
-                'utt': 2044, 'utw': 2058
-            }
-            res_type = ext_map.get(ext.lower(), default_type)
-            return cls(name, res_type)
-        return cls(filename, default_type)
+        name, sep, ext = filename.rpartition('.')
+        if not sep:
+            return cls(filename, default_type)
+        return cls(name, EXT_TO_RESTYPE.get(ext.lower(), default_type))
 
 
 class ResContainer(ABC):
@@ -71,27 +99,76 @@ class ResContainer(ABC):
         """List all resources in container"""
         pass
 
+    def iter_resources(self, prefix: Optional[str] = None) -> Iterator[ResRef]:
+        """Iterate resources, optionally limited to names starting with prefix"""
+        for resref in self.list_resources():
+            if prefix is None or resref.name.startswith(prefix):
+                yield resref
+
 
 class ResDir(ResContainer):
     """Directory-based resource container"""
     
+    # How many file mappings to keep alive for get_view
+    MMAP_CACHE_SIZE = 32
+
     def __init__(self, path: str):
         self.path = Path(path)
-        self._cache: Optional[Dict[ResRef, Path]] = None
+        self._cache: Optional[Dict[ResRef, str]] = None
+        self._mmaps: 'OrderedDict[str, mmap.mmap]' = OrderedDict()
         self._build_cache()
-        
+
     def _build_cache(self):
         """Build cache of available resources"""
         self._cache = {}
         if not self.path.exists():
             logger.warning(f"ResDir path does not exist: {self.path}")
             return
-            
-        for file_path in self.path.rglob('*'):
-            if file_path.is_file():
-                resref = ResRef.from_filename(file_path.name)
-                self._cache[resref] = file_path
-                
+
+        # Walk with os.scandir: DirEntry carries the file type from the
+        # batched directory read, so no per-file stat, and entry.path is a
+        # plain str, avoiding a Path object per file. Directories are
+        # fanned out to worker threads — scandir releases the GIL, so
+        # enumeration of deep trees overlaps I/O waits instead of
+        # serializing every opendir.
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        dir_queue: 'queue.Queue[Optional[str]]' = queue.Queue()
+        dir_queue.put(str(self.path))
+        results: List[List[Tuple[ResRef, str]]] = []
+
+        def worker():
+            local: List[Tuple[ResRef, str]] = []
+            results.append(local)
+            while True:
+                current = dir_queue.get()
+                if current is None:
+                    break
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            if entry.is_file(follow_symlinks=False):
+                                local.append(
+                                    (ResRef.from_filename(entry.name), entry.path))
+                            elif entry.is_dir(follow_symlinks=False):
+                                dir_queue.put(entry.path)
+                except OSError as e:
+                    logger.warning(f"Failed to scan {current}: {e}")
+                finally:
+                    dir_queue.task_done()
+
+        threads = [threading.Thread(target=worker, daemon=True)
+                   for _ in range(workers)]
+        for t in threads:
+            t.start()
+        dir_queue.join()
+        for _ in threads:
+            dir_queue.put(None)
+        for t in threads:
+            t.join()
+
+        for local in results:
+            self._cache.update(local)
+
         logger.debug(f"ResDir loaded {len(self._cache)} resources from {self.path}")
         
     def contains(self, resref: ResRef) -> bool:
@@ -106,16 +183,61 @@ class ResDir(ResContainer):
         except IOError as e:
             logger.error(f"Failed to read {resref}: {e}")
             return None
-            
+
+    def get_source_path(self, resref: ResRef) -> Optional[str]:
+        """Filesystem path backing a resource, if present"""
+        return self._cache.get(resref)
+
+    def get_view(self, resref: ResRef) -> Optional[memoryview]:
+        """Zero-copy view of a resource backed by mmap.
+
+        Large assets are served straight from the page cache without a
+        kernel-to-user copy or a bytes allocation; callers that only scan
+        a header avoid reading the whole file. Mappings are kept in a
+        small LRU keyed by path.
+        """
+        path = self._cache.get(resref)
+        if path is None:
+            return None
+
+        mapped = self._mmaps.get(path)
+        if mapped is None:
+            try:
+                with open(path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return memoryview(b'')
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (IOError, ValueError) as e:
+                logger.error(f"Failed to map {resref}: {e}")
+                return None
+            self._mmaps[path] = mapped
+            if len(self._mmaps) > self.MMAP_CACHE_SIZE:
+                # Drop the reference only; the mapping closes once any
+                # outstanding views are released
+                self._mmaps.popitem(last=False)
+        else:
+            self._mmaps.move_to_end(path)
+
+        return memoryview(mapped)
+
     def list_resources(self) -> List[ResRef]:
         return list(self._cache.keys())
 
+    def iter_resources(self, prefix: Optional[str] = None) -> Iterator[ResRef]:
+        if prefix is None:
+            yield from self._cache
+        else:
+            for resref in self._cache:
+                if resref.name.startswith(prefix):
+                    yield resref
+
 
 class ResErf(ResContainer):
     """ERF-based resource container"""
-    
+
     def __init__(self, erf: Erf):
         self.erf = erf
+        self._resrefs: Optional[List[ResRef]] = None
         
     @classmethod
     def from_file(cls, file_path: str):
@@ -130,11 +252,18 @@ class ResErf(ResContainer):
         entry = self.erf.get_entry(resref.name, resref.res_type)
         return entry.data if entry else None
         
-    def list_resources(self) -> List[ResRef]:
-        resources = []
-        for entry in self.erf.list_entries():
-            resources.append(ResRef(entry.resref, entry.res_type))
-        return resources
+    def list_resources(self) -> Iterable[ResRef]:
+        # Built once on first use; repeat listings reuse the same ResRefs
+        # instead of reconstructing one per entry per call
+        if self._resrefs is None:
+            self._resrefs = [ResRef(entry.resref, entry.res_type)
+                             for entry in self.erf.list_entries()]
+        return self._resrefs
+
+    def iter_resources(self, prefix: Optional[str] = None) -> Iterator[ResRef]:
+        for resref in self.list_resources():
+            if prefix is None or resref.name.startswith(prefix):
+                yield resref
 
 
 class ResNWSync(ResContainer):
@@ -146,12 +275,13 @@ class ResNWSync(ResContainer):
         self.manifest = repository.read_manifest(manifest_hash)
         if not self.manifest:
             raise ValueError(f"Manifest not found: {manifest_hash}")
-            
+        # One-time lookup table; probes are a dict hit instead of a linear
+        # scan over potentially hundreds of thousands of entries
+        self._lookup = {(e.resref, e.res_type): e for e in self.manifest.entries}
+        self._resrefs: Optional[List[ResRef]] = None
+
     def contains(self, resref: ResRef) -> bool:
-        for entry in self.manifest.entries:
-            if entry.resref == resref.name and entry.res_type == resref.res_type:
-                return True
-        return False
+        return (resref.name, resref.res_type) in self._lookup
         
     def get_data(self, resref: ResRef) -> Optional[bytes]:
         # This would need to implement actual data retrieval from NWSync
@@ -159,24 +289,41 @@ class ResNWSync(ResContainer):
         logger.warning("NWSync data retrieval not yet implemented")
         return None
         
-    def list_resources(self) -> List[ResRef]:
-        resources = []
-        for entry in self.manifest.entries:
-            resources.append(ResRef(entry.resref, entry.res_type))
-        return resources
+    def list_resources(self) -> Iterable[ResRef]:
+        # Built once on first use; see ResErf.list_resources
+        if self._resrefs is None:
+            self._resrefs = [ResRef(entry.resref, entry.res_type)
+                             for entry in self.manifest.entries]
+        return self._resrefs
+
+    def iter_resources(self, prefix: Optional[str] = None) -> Iterator[ResRef]:
+        for resref in self.list_resources():
+            if prefix is None or resref.name.startswith(prefix):
+                yield resref
 
 
 class ResMan:
     """Resource Manager - combines multiple containers with priority"""
     
-    def __init__(self, cache_size: int = 1000):
+    def __init__(self, cache_size: int = 1000,
+                 cache_bytes_limit: int = 256 * 1024 * 1024):
         self.containers: List[ResContainer] = []
         self.cache_size = cache_size
-        self._cache: Dict[ResRef, bytes] = {}
-        
+        self.cache_bytes_limit = cache_bytes_limit
+        self.cache_bytes = 0
+        # Cache and index are keyed by plain (name, res_type) tuples;
+        # CPython hashes and compares those without dispatching into
+        # ResRef.__hash__/__eq__ on every probe
+        self._cache: 'OrderedDict[Tuple[str, int], bytes]' = OrderedDict()
+        # Merged resource index; later-added (higher priority) containers
+        # overwrite earlier ones, so lookup is one dict probe
+        self._index: Dict[Tuple[str, int], ResContainer] = {}
+
     def add_container(self, container: ResContainer):
         """Add a resource container (higher priority containers should be added last)"""
         self.containers.append(container)
+        for resref in container.list_resources():
+            self._index[(resref.name, resref.res_type)] = container
         logger.debug(f"Added container: {type(container).__name__}")
         
     def add_directory(self, path: str):
@@ -194,30 +341,33 @@ class ResMan:
         
     def contains(self, resref: ResRef) -> bool:
         """Check if any container has the resource"""
-        for container in reversed(self.containers):  # Check highest priority first
-            if container.contains(resref):
-                return True
-        return False
-        
+        return (resref.name, resref.res_type) in self._index
+
     def get_data(self, resref: ResRef) -> Optional[bytes]:
         """Get resource data from highest priority container"""
-        # Check cache first
-        if resref in self._cache:
-            return self._cache[resref]
-            
-        # Check containers in reverse order (highest priority first)
-        for container in reversed(self.containers):
-            if container.contains(resref):
-                data = container.get_data(resref)
-                if data is not None:
-                    # Cache the result
-                    if len(self._cache) >= self.cache_size:
-                        # Simple cache eviction (remove oldest)
-                        oldest_key = next(iter(self._cache))
-                        del self._cache[oldest_key]
-                    self._cache[resref] = data
-                    return data
-                    
+        key = (resref.name, resref.res_type)
+
+        # Check cache first; a hit becomes most-recently-used
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        container = self._index.get(key)
+        if container is not None:
+            data = container.get_data(resref)
+            if data is not None:
+                # Cache the result, evicting least-recently-used until
+                # both the entry and byte budgets are respected; a few
+                # huge assets can no longer pin unbounded memory
+                self._cache[key] = data
+                self.cache_bytes += len(data)
+                while self._cache and (
+                        self.cache_bytes > self.cache_bytes_limit
+                        or len(self._cache) > self.cache_size):
+                    _, evicted = self._cache.popitem(last=False)
+                    self.cache_bytes -= len(evicted)
+                return data
+
         return None
         
     def list_all_resources(self) -> List[ResRef]:
@@ -226,45 +376,89 @@ class ResMan:
         for container in self.containers:
             all_resources.update(container.list_resources())
         return list(all_resources)
+
+    def iter_all_resources(self, prefix: Optional[str] = None) -> Iterator[ResRef]:
+        """Iterate resources from all containers without building the union set"""
+        seen = set()
+        for container in reversed(self.containers):
+            for resref in container.iter_resources(prefix):
+                if resref not in seen:
+                    seen.add(resref)
+                    yield resref
         
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about the resource manager"""
         stats = {
             'containers': len(self.containers),
             'cached_resources': len(self._cache),
+            'cached_bytes': self.cache_bytes,
             'total_resources': len(self.list_all_resources())
         }
         return stats
         
     def grep(self, pattern: str, case_sensitive: bool = False) -> List[ResRef]:
         """Find resources matching a pattern"""
-        import re
         flags = 0 if case_sensitive else re.IGNORECASE
         regex = re.compile(pattern, flags)
-        
-        matches = []
-        for resref in self.list_all_resources():
-            if regex.search(str(resref)):
-                matches.append(resref)
-                
-        return matches
-        
+
+        # Stream candidates instead of materializing the union of every
+        # container listing. search() matches anywhere in the name, so
+        # the prefix pre-filter only applies to ^-anchored patterns.
+        return [resref for resref in self.iter_all_resources(_anchored_prefix(pattern))
+                if regex.search(str(resref))]
+
     def extract_to_directory(self, output_dir: str, pattern: str = "*"):
         """Extract resources to a directory"""
-        import fnmatch
-        
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
-        
+
+        # Translate the glob once; fnmatch.fnmatch would re-derive the
+        # regex on every entry
+        regex = re.compile(fnmatch.translate(pattern))
+
+        def extract_one(resref: ResRef, name: str) -> bool:
+            container = self._index.get((resref.name, resref.res_type))
+            if container is None:
+                return False
+
+            # Path-backed entries are copied kernel-side (copy_file_range
+            # on Linux) without reading the bytes into Python at all.
+            # Like the container read paths, an I/O failure on one entry
+            # is logged and skipped rather than aborting the bulk extract.
+            try:
+                get_source_path = getattr(container, 'get_source_path', None)
+                if get_source_path is not None:
+                    src = get_source_path(resref)
+                    if src and os.path.getsize(src) > 0:
+                        shutil.copyfile(src, output_path / name)
+                        return True
+                    return False
+
+                data = container.get_data(resref)
+                if not data:
+                    return False
+                with open(output_path / name, 'wb') as f:
+                    f.write(data)
+                return True
+            except OSError as e:
+                logger.error(f"Failed to extract {resref}: {e}")
+                return False
+
+        # Small synchronous writes dominate serial extraction; fan the
+        # per-file work out to a thread pool. Containers are read directly
+        # (not through the shared LRU cache), which also keeps a bulk
+        # extract from evicting the hot cache entries.
+        workers = min(32, (os.cpu_count() or 1) * 2)
         extracted = 0
-        for resref in self.list_all_resources():
-            if fnmatch.fnmatch(str(resref), pattern):
-                data = self.get_data(resref)
-                if data:
-                    file_path = output_path / str(resref)
-                    with open(file_path, 'wb') as f:
-                        f.write(data)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            candidates = ((resref, str(resref))
+                          for resref in self.iter_all_resources(_static_prefix(pattern)))
+            futures = [pool.submit(extract_one, resref, name)
+                       for resref, name in candidates
+                       if regex.match(name)]
+            for future in concurrent.futures.as_completed(futures):
+                if future.result():
                     extracted += 1
-                    
+
         logger.info(f"Extracted {extracted} resources to {output_dir}")
         return extracted
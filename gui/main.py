@@ -5,6 +5,8 @@ Provides graphical interface for NWN tools
 
 import sys
 import logging
+import queue
+import concurrent.futures
 from pathlib import Path
 import os
 
@@ -29,6 +31,15 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+# Tools whose CLI expects a subcommand; when the GUI-built argv omits one
+# (or names an unknown one), the default is inserted before dispatch
+_DEFAULT_SUBCOMMAND = {"tlk": "convert", "gff": "convert", "twoda": "convert"}
+_KNOWN_SUBS = {
+    "tlk": frozenset({"convert", "info"}),
+    "gff": frozenset({"convert", "info"}),
+    "twoda": frozenset({"convert", "info"}),
+}
+
 
 class MainWindow:
     """Main GUI window"""
@@ -45,6 +56,11 @@ class MainWindow:
         self.setup_ui()
         self.setup_logging()
 
+        # Commands run off the mainloop so the UI (and the log drain tick)
+        # keeps pumping. Single worker: the CLI entry point mutates the
+        # process-global sys.argv, so runs must be serialized.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
         # Install global Tk error handler so UI never closes on exceptions
         def _report_callback_exception(exc, val, tb):
             import traceback
@@ -87,28 +103,54 @@ class MainWindow:
         self.tool_selector.on_tool_changed = self.on_tool_changed
         self.config_panel.on_run_command = self.on_run_command
         
+    # How often the queued log records are flushed to the output panel,
+    # and how many are coalesced per flush
+    LOG_DRAIN_MS = 50
+    LOG_DRAIN_BATCH = 200
+
     def setup_logging(self):
         """Setup logging to GUI"""
-        # Create a custom handler that writes to the output panel
+        # Custom handler that only queues records: emit() may run on any
+        # thread, and Tk widgets must be touched from the mainloop. The
+        # queue is drained in batches on a timer, so a chatty command
+        # costs one text-widget update per tick instead of one per record.
         class GUILogHandler(logging.Handler):
-            def __init__(self, output_panel):
+            def __init__(self):
                 super().__init__()
-                self.output_panel = output_panel
-                
+                self.queue = queue.Queue()
+
             def emit(self, record):
-                msg = self.format(record)
-                self.output_panel.append_text(msg + '\n')
-        
+                try:
+                    self.queue.put_nowait(self.format(record))
+                except Exception:
+                    self.handleError(record)
+
         # Add GUI handler
-        gui_handler = GUILogHandler(self.output_panel)
+        gui_handler = GUILogHandler()
         gui_handler.setFormatter(logging.Formatter(
             '%(levelname)s [%(asctime)s] %(message)s',
             datefmt='%H:%M:%S'
         ))
-        
+
         root_logger = logging.getLogger()
         root_logger.addHandler(gui_handler)
         root_logger.setLevel(logging.INFO)
+
+        self._gui_log_handler = gui_handler
+        self.root.after(self.LOG_DRAIN_MS, self._drain_log)
+
+    def _drain_log(self):
+        """Flush queued log records to the output panel in one update"""
+        log_queue = self._gui_log_handler.queue
+        messages = []
+        while len(messages) < self.LOG_DRAIN_BATCH:
+            try:
+                messages.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            self.output_panel.append_text('\n'.join(messages) + '\n')
+        self.root.after(self.LOG_DRAIN_MS, self._drain_log)
         
     def on_tool_changed(self, tool_name):
         """Handle tool selection change"""
@@ -127,12 +169,10 @@ class MainWindow:
                 return
 
             # Auto-insert default subcommands where applicable to avoid CLI errors
-            if command_args[0] == "tlk" and (len(command_args) == 1 or command_args[1] not in ("convert", "info")):
-                command_args = ["tlk", "convert"] + command_args[1:]
-            if command_args[0] == "gff" and (len(command_args) == 1 or command_args[1] not in ("convert", "info")):
-                command_args = ["gff", "convert"] + command_args[1:]
-            if command_args[0] == "twoda" and (len(command_args) == 1 or command_args[1] not in ("convert", "info")):
-                command_args = ["twoda", "convert"] + command_args[1:]
+            sub = _DEFAULT_SUBCOMMAND.get(command_args[0])
+            if sub and (len(command_args) == 1
+                        or command_args[1] not in _KNOWN_SUBS[command_args[0]]):
+                command_args.insert(1, sub)
 
             # Debug: Show the exact command being run
             debug_msg = f"Debug: Command args = {command_args}"
@@ -142,26 +182,20 @@ class MainWindow:
             # Import and run the appropriate CLI command
             from cli.main import main as cli_main
 
-            # Save original sys.argv
-            original_argv = sys.argv[:]
-
-            try:
-                # Set argv for the CLI command
-                sys.argv = ['nwpy'] + command_args
-                logger.info(f"Debug: sys.argv = {sys.argv}")
-
-                # Run command
-                result = cli_main()
-
-                if result == 0:
-                    logger.info("Command completed successfully")
-                else:
-                    # result may be None if the command raised and was caught inside CLI
-                    logger.error(f"Command failed with exit code {result if result is not None else 'unknown'}")
-
-            finally:
-                # Restore original argv
-                sys.argv = original_argv
+            def run_cli():
+                # argv save/restore happens inside the worker; runs are
+                # serialized by the single-worker executor
+                original_argv = sys.argv[:]
+                try:
+                    sys.argv = ['nwpy'] + command_args
+                    logger.info(f"Debug: sys.argv = {sys.argv}")
+                    return cli_main()
+                finally:
+                    sys.argv = original_argv
+
+            future = self._executor.submit(run_cli)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._on_command_done, f))
 
         except Exception as e:
             # Do not crash the GUI; surface the error
@@ -170,7 +204,25 @@ class MainWindow:
             logger.error(f"Error executing command: {e}")
             self.output_panel.append_text(error_msg)
             messagebox.showerror("Execution error", str(e))
-        
+
+    def _on_command_done(self, future):
+        """Report a finished command; runs on the mainloop"""
+        try:
+            result = future.result()
+        except Exception as e:
+            import traceback
+            error_msg = f"{e}\n" + traceback.format_exc()
+            logger.error(f"Error executing command: {e}")
+            self.output_panel.append_text(error_msg)
+            messagebox.showerror("Execution error", str(e))
+            return
+
+        if result == 0:
+            logger.info("Command completed successfully")
+        else:
+            # result may be None if the command raised and was caught inside CLI
+            logger.error(f"Command failed with exit code {result if result is not None else 'unknown'}")
+
     def run(self):
         """Start the GUI main loop"""
         self.root.mainloop()
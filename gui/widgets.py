@@ -2,10 +2,271 @@
 GUI widgets for the NWN tools interface
 """
 
+import os
+import sys
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 
+# Shared status suffixes for the tool catalog; one string object each
+# instead of a copy embedded in every description literal
+_IMPL = " - ✅ Implemented"
+_FRAMEWORK = " - ✅ Framework ready"
+_PLACEHOLDER = " - ⚠️ Placeholder"
+
+# Tool catalog shown by ToolSelector; read-only, so shared at module
+# scope rather than rebuilt per selector instance
+_TOOLS = {
+    "NWSync Tools": [
+        ("nwsync write", "Create NWSync manifests" + _IMPL),
+        ("nwsync print", "Print manifest contents" + _IMPL),
+        ("nwsync fetch", "Fetch NWSync data" + _PLACEHOLDER),
+        ("nwsync prune", "Prune NWSync repository" + _PLACEHOLDER),
+    ],
+    "Archive Tools": [
+        ("erf pack", "Pack ERF archives" + _IMPL),
+        ("erf unpack", "Unpack ERF archives" + _IMPL),
+        ("key pack", "Pack KEY files" + _FRAMEWORK),
+        ("key unpack", "Unpack KEY files" + _FRAMEWORK),
+        ("key list", "List KEY contents" + _FRAMEWORK),
+        ("key shadows", "Show KEY shadows" + _FRAMEWORK),
+    ],
+    "Format Tools": [
+        ("gff convert", "Convert GFF files" + _FRAMEWORK),
+        ("gff info", "Display GFF information" + _FRAMEWORK),
+        ("tlk convert", "Convert TLK files" + _FRAMEWORK),
+        ("tlk info", "Display TLK information" + _FRAMEWORK),
+        ("twoda convert", "Convert 2DA files" + _FRAMEWORK + " (with --minify)"),
+        ("twoda info", "Display 2DA information" + _FRAMEWORK),
+    ],
+    "Resource Manager": [
+        ("resman extract", "Extract resources" + _FRAMEWORK),
+        ("resman stats", "Show resource statistics" + _FRAMEWORK),
+        ("resman grep", "Search resources" + _FRAMEWORK),
+        ("resman cat", "Print resource contents" + _FRAMEWORK),
+        ("resman diff", "Compare resource containers" + _FRAMEWORK),
+    ],
+    "Development": [
+        ("script compile", "Compile NWScript" + _FRAMEWORK),
+        ("script decompile", "Decompile NWScript" + _FRAMEWORK),
+        ("script disasm", "Disassemble NWScript" + _FRAMEWORK),
+    ]
+}
+
+# Inline usage strings for Show Help; allocated once, keys interned to
+# match the tool-name strings produced by ToolSelector
+_HELP_MAP = {sys.intern(k): v for k, v in {
+    "tlk convert": "tlk convert INPUT [-o OUTPUT] [--to-json]",
+    "tlk info": "tlk info INPUT [--verbose]",
+    "gff convert": "gff convert INPUT [-o OUTPUT] [--to-json]",
+    "gff info": "gff info INPUT [-v|--verbose]",
+    "twoda convert": "twoda convert INPUT [-o OUTPUT] [--to-csv] [--to-json] [--minify]",
+    "twoda info": "twoda info INPUT [--verbose]",
+    "erf pack": "erf pack INPUT_DIR [-o OUTPUT.erf]",
+    "erf unpack": "erf unpack INPUT.erf [-o OUTPUT_DIR]",
+    "key pack": "key pack INPUT_DIR [-o OUTPUT.key]",
+    "key unpack": "key unpack INPUT.key [-o OUTPUT_DIR]",
+    "key list": "key list INPUT.key",
+    "key shadows": "key shadows INPUT.key",
+    "resman extract": "resman extract [-o DIR] [-p PATTERN] [--type TYPE]",
+    "resman grep": "resman grep PATTERN [--type TYPE]",
+    "resman cat": "resman cat NAME.ext",
+    "resman stats": "resman stats",
+    "resman diff": "resman diff FIRST_DIR SECOND_DIR",
+    "script compile": "script compile INPUT.nss [-o OUTPUT.ncs] [-i INCLUDES] [--dummy] [-v]",
+    "script decompile": "script decompile INPUT.ncs [-o OUTPUT.nss]",
+    "script disasm": "script disasm INPUT.ncs",
+    "nwsync write": "nwsync-write ROOT SPEC... [--name NAME] [--description TEXT] [--group-id ID] [--limit-file-size MB] [--with-module] [--dry-run]",
+    "nwsync print": "nwsync-print MANIFEST [--verify] [-r REPO_ROOT]",
+}.items()}
+
+
+# Per-tool configuration forms, as (widget_kind, label, key, kwargs) rows.
+# ConfigPanel builds each tool's frame from this table the first time the
+# tool is selected and caches it; tools without an entry get the generic
+# "configuration panel pending" label.
+_TOOL_SCHEMAS = {
+    'nwsync write': (
+        ('file', 'Storage Directory', 'root', {'is_directory': True}),
+        ('file', 'Module/ERF Files', 'specs', {'multiple': True}),
+        ('text', 'Name', 'name', {}),
+        ('text', 'Description', 'description', {}),
+        ('check', 'Include Module Contents', 'with_module', {}),
+        ('number', 'Group ID', 'group_id', {'default': 0}),
+    ),
+    'nwsync print': (
+        ('file', 'Manifest File', 'manifest', {}),
+        ('check', 'Verify Files', 'verify', {}),
+    ),
+    'erf pack': (
+        ('file', 'Input Directory', 'input_dir', {'is_directory': True}),
+        ('file', 'Output ERF', 'output_erf', {'save': True}),
+    ),
+    'erf unpack': (
+        ('file', 'Input ERF', 'input_erf', {}),
+        ('file', 'Output Directory', 'output_dir', {'is_directory': True}),
+    ),
+    'gff convert': (
+        ('file', 'Input GFF File', 'input', {}),
+        ('file', 'Output File', 'output', {'save': True}),
+        ('check', 'Convert to JSON', 'to_json', {'default': True}),
+    ),
+    'gff info': (
+        ('file', 'Input GFF File', 'input', {}),
+        ('check', 'Verbose Output', 'verbose', {}),
+    ),
+    'tlk convert': (
+        ('file', 'Input TLK File', 'input', {}),
+        ('file', 'Output File (optional)', 'output', {'save': True}),
+        ('check', 'Convert to JSON', 'to_json', {'default': True}),
+    ),
+    'tlk info': (
+        ('file', 'Input TLK File', 'input', {}),
+        ('check', 'Verbose Output', 'verbose', {}),
+    ),
+    'twoda convert': (
+        ('file', 'Input 2DA File', 'input', {}),
+        ('file', 'Output File', 'output', {'save': True}),
+        ('check', 'Convert to CSV', 'to_csv', {}),
+        ('check', 'Convert to JSON', 'to_json', {}),
+        ('check', 'Minify Output', 'minify', {}),
+    ),
+    'twoda info': (
+        ('file', 'Input 2DA File', 'input', {}),
+        ('check', 'Verbose Output', 'verbose', {}),
+    ),
+    'key pack': (
+        ('file', 'Input Directory', 'input', {'is_directory': True}),
+        ('file', 'Output KEY File', 'output', {'save': True}),
+    ),
+    'key unpack': (
+        ('file', 'Input KEY File', 'input', {}),
+        ('file', 'Output Directory', 'output', {'is_directory': True}),
+    ),
+    'key list': (
+        ('file', 'Input KEY File', 'input', {}),
+    ),
+    'key shadows': (
+        ('file', 'Input KEY File', 'input', {}),
+    ),
+    'resman extract': (
+        ('file', 'Output Directory', 'output', {'is_directory': True}),
+        ('text', 'Pattern Filter', 'pattern', {}),
+        ('text', 'Resource Type', 'type', {}),
+    ),
+    'resman cat': (
+        ('text', 'Resource Name', 'resource', {}),
+    ),
+    'resman grep': (
+        ('text', 'Search Pattern', 'pattern', {}),
+        ('text', 'Resource Type', 'type', {}),
+    ),
+    'resman diff': (
+        ('file', 'First Container', 'first', {}),
+        ('file', 'Second Container', 'second', {}),
+    ),
+    'script compile': (
+        ('file', 'Input NSS File', 'input', {}),
+        ('file', 'Output NCS File', 'output', {'save': True}),
+        ('file', 'Includes Directory', 'includes', {'is_directory': True}),
+        ('check', 'Verbose Output', 'verbose', {}),
+        ('check', 'Create Dummy Output (for testing)', 'dummy', {}),
+    ),
+    'script decompile': (
+        ('file', 'Input NCS File', 'input', {}),
+        ('file', 'Output NSS File', 'output', {'save': True}),
+    ),
+    'script disasm': (
+        ('file', 'Input NCS File', 'input', {}),
+    ),
+}
+
+
+# Config keys that become positional CLI operands rather than --flags
+_POSITIONAL_KEYS = frozenset({
+    'root', 'manifest',
+    'input_dir', 'input_erf',
+    'output_dir', 'output_erf',
+    'input', 'output',
+    'first', 'second',
+    'resource', 'pattern',
+})
+
+# key -> "--flag-name", derived once from the schemas instead of
+# rebuilding the string on every Run click
+_FLAG_NAME = {
+    key: f"--{key.replace('_', '-')}"
+    for schema in _TOOL_SCHEMAS.values()
+    for _kind, _label, key, _kw in schema
+}
+
+
+def _make_argv_builder(tool_name):
+    """Bake an argv-assembly closure for one tool.
+
+    The positional/flag classification of each config key is fixed by the
+    schema, so it is resolved here once; the returned closure just walks a
+    precomputed (key, role) plan against the current values. Returns None
+    from the closure when a required operand is missing so the caller can
+    prompt instead of emitting a broken command line.
+    """
+    tool_parts = tool_name.split()
+    plan = []
+    for kind, _label, key, _kw in _TOOL_SCHEMAS.get(tool_name, ()):
+        if kind == 'check':
+            role = 'bool'
+        elif key == 'specs':
+            role = 'multi'
+        elif key in _POSITIONAL_KEYS:
+            role = 'positional'
+        else:
+            role = 'flag'
+        plan.append((key, role))
+
+    # tlk convert passes its output via -o rather than positionally and
+    # requires an input file; encoded here instead of branching per click
+    tlk_convert = tool_parts[0] == 'tlk' and (
+        len(tool_parts) == 1 or tool_parts[1] == 'convert')
+
+    def build(values):
+        positionals = []
+        flags = []
+        for key, role in plan:
+            value = values.get(key)
+            if not value:
+                continue
+            if role == 'bool':
+                flags.append(_FLAG_NAME[key])
+            elif role == 'multi':
+                if isinstance(value, list):
+                    positionals.extend(value)
+                else:
+                    positionals.extend(value.split(';'))
+            elif role == 'positional':
+                positionals.append(value)
+            else:
+                flags.append(_FLAG_NAME[key])
+                flags.append(value)
+
+        if tlk_convert:
+            if not positionals:
+                return None
+            args = ['tlk', 'convert', positionals[0]]
+            if len(positionals) > 1:
+                args.extend(['-o', positionals[1]])
+            args.extend(flags)
+            return args
+
+        return tool_parts + positionals + flags
+
+    return build
+
+
+# Baked argv builders, one per tool, created on first use
+_ARGV_BUILDERS = {}
+
+
 class ToolSelector(ttk.LabelFrame):
     """Widget for selecting which NWN tool to use"""
     
@@ -13,47 +274,22 @@ class ToolSelector(ttk.LabelFrame):
         super().__init__(parent, text="Tool Selection", padding=10)
         
         self.on_tool_changed = None
-        
-        # Available tools
-        self.tools = {
-            "NWSync Tools": [
-                ("nwsync write", "Create NWSync manifests - ✅ Implemented"),
-                ("nwsync print", "Print manifest contents - ✅ Implemented"),
-                ("nwsync fetch", "Fetch NWSync data - ⚠️ Placeholder"),
-                ("nwsync prune", "Prune NWSync repository - ⚠️ Placeholder"),
-            ],
-            "Archive Tools": [
-                ("erf pack", "Pack ERF archives - ✅ Implemented"),
-                ("erf unpack", "Unpack ERF archives - ✅ Implemented"),
-                ("key pack", "Pack KEY files - ✅ Framework ready"),
-                ("key unpack", "Unpack KEY files - ✅ Framework ready"),
-                ("key list", "List KEY contents - ✅ Framework ready"),
-                ("key shadows", "Show KEY shadows - ✅ Framework ready"),
-            ],
-            "Format Tools": [
-                ("gff convert", "Convert GFF files - ✅ Framework ready"),
-                ("gff info", "Display GFF information - ✅ Framework ready"),
-                ("tlk convert", "Convert TLK files - ✅ Framework ready"),
-                ("tlk info", "Display TLK information - ✅ Framework ready"),
-                ("twoda convert", "Convert 2DA files - ✅ Framework ready (with --minify)"),
-                ("twoda info", "Display 2DA information - ✅ Framework ready"),
-            ],
-            "Resource Manager": [
-                ("resman extract", "Extract resources - ✅ Framework ready"),
-                ("resman stats", "Show resource statistics - ✅ Framework ready"),
-                ("resman grep", "Search resources - ✅ Framework ready"),
-                ("resman cat", "Print resource contents - ✅ Framework ready"),
-                ("resman diff", "Compare resource containers - ✅ Framework ready"),
-            ],
-            "Development": [
-                ("script compile", "Compile NWScript - ✅ Framework ready"),
-                ("script decompile", "Decompile NWScript - ✅ Framework ready"),
-                ("script disasm", "Disassemble NWScript - ✅ Framework ready"),
-            ]
+        self._last_emitted = None
+        self._selected_tool = None
+
+        # Available tools (shared, read-only catalog)
+        self.tools = _TOOLS
+        self._categories = tuple(self.tools)
+
+        # Combo display strings never change; format them once instead of
+        # per category switch
+        self._tool_display = {
+            cat: tuple(f"{name} - {desc}" for name, desc in items)
+            for cat, items in self.tools.items()
         }
-        
+
         self.setup_ui()
-        
+
     def setup_ui(self):
         """Setup the tool selector UI"""
         # Tool category dropdown
@@ -63,7 +299,7 @@ class ToolSelector(ttk.LabelFrame):
         self.category_combo = ttk.Combobox(
             self, 
             textvariable=self.category_var,
-            values=list(self.tools.keys()),
+            values=self._categories,
             state="readonly"
         )
         self.category_combo.pack(fill=tk.X, pady=(0, 10))
@@ -82,58 +318,57 @@ class ToolSelector(ttk.LabelFrame):
         self.tool_combo.bind('<<ComboboxSelected>>', self.on_tool_selected)
         
         # Tool description
-        self.description_var = tk.StringVar()
-        self.description_label = ttk.Label(
-            self,
-            textvariable=self.description_var,
-            wraplength=300,
-            foreground="gray"
-        )
+        # Plain text label updated via configure(text=...), which skips
+        # the StringVar trace round-trip; the longest catalog entries do
+        # wrap at panel width, so keep wraplength
+        self.description_label = ttk.Label(self, foreground="gray",
+                                           wraplength=300)
         self.description_label.pack(anchor=tk.W)
         
-        # Set default selection
-        if self.tools:
-            first_category = list(self.tools.keys())[0]
-            self.category_var.set(first_category)
-            self.on_category_changed(None)
+        # Set default selection once the mainloop is idle: the cascade
+        # triggers on_tool_changed, which builds the first config form,
+        # so running it synchronously here would pay that build before
+        # the window is even mapped (and before callers have had a
+        # chance to attach their callbacks)
+        if self._categories:
+            self.after_idle(self._apply_default_selection)
+
+    def _apply_default_selection(self):
+        """Select the first category (and thus first tool)"""
+        self.category_var.set(self._categories[0])
+        self.on_category_changed(None)
             
     def on_category_changed(self, event):
         """Handle category selection change"""
         category = self.category_var.get()
-        if category in self.tools:
-            tools = self.tools[category]
-            tool_names = [f"{tool[0]} - {tool[1]}" for tool in tools]
-            self.tool_combo['values'] = tool_names
-            
-            if tools:
-                self.tool_combo.current(0)
-                self.on_tool_selected(None)
+        display = self._tool_display.get(category)
+        if display:
+            self.tool_combo['values'] = display
+            self.tool_combo.current(0)
+            self.on_tool_selected(None)
                 
     def on_tool_selected(self, event):
         """Handle tool selection change"""
-        selection = self.tool_var.get()
-        if selection:
-            # Extract tool name (before the ' - ')
-            tool_name = selection.split(' - ')[0]
-            
-            # Find description
-            category = self.category_var.get()
-            if category in self.tools:
-                for tool, desc in self.tools[category]:
-                    if tool == tool_name:
-                        self.description_var.set(desc)
-                        break
-            
-            # Notify callback
-            if self.on_tool_changed:
-                self.on_tool_changed(tool_name)
-                
+        # The combobox index maps straight into the category's tool list;
+        # no need to re-parse the display string we formatted ourselves
+        idx = self.tool_combo.current()
+        if idx < 0:
+            return
+        tool_name, desc = self.tools[self.category_var.get()][idx]
+        self._selected_tool = tool_name
+        self.description_label.configure(text=desc)
+
+        # Notify callback, but only when the selection actually
+        # changed; <<ComboboxSelected>> can refire on focus moves
+        if self.on_tool_changed and tool_name != self._last_emitted:
+            self._last_emitted = tool_name
+            self.on_tool_changed(tool_name)
+
     def get_selected_tool(self):
         """Get the currently selected tool name"""
-        selection = self.tool_var.get()
-        if selection:
-            return selection.split(' - ')[0]
-        return None
+        # Tracked in on_tool_selected; reading it back here avoids two
+        # Tcl round-trips per query
+        return self._selected_tool
 
 
 class ConfigPanel(ttk.LabelFrame):
@@ -145,7 +380,24 @@ class ConfigPanel(ttk.LabelFrame):
         self.on_run_command = None
         self.current_tool = None
         self.config_widgets = {}
-        
+
+        # Built tool forms, cached as tool name -> (frame, widgets dict).
+        # Switching tools packs/unpacks cached frames instead of destroying
+        # and recreating every widget.
+        self._tool_frames = {}
+        self._active_frame = None
+
+        # Baked argv builder for the current tool (set by set_tool)
+        self._build_argv = None
+
+        # Last directory chosen per config key, so the file dialog
+        # reopens where the user was instead of re-walking home
+        self._last_dir = {}
+
+        # Help dialog, created on first use and then only hidden/shown
+        self._help_window = None
+        self._help_text = None
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -155,11 +407,10 @@ class ConfigPanel(ttk.LabelFrame):
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas)
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
+        self._last_scrollregion = None
+        self._cfg_pending = None
+        self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
+
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
         
@@ -186,217 +437,179 @@ class ConfigPanel(ttk.LabelFrame):
         )
         self.help_button.pack(side=tk.LEFT)
         
+    def _on_frame_configure(self, event=None):
+        """Coalesce <Configure> bursts into one scrollregion update.
+
+        Tk fires dozens of geometry events per second during a resize;
+        scheduling a single after_idle callback lets a whole burst settle
+        before the bbox("all") traversal runs once.
+        """
+        if self._cfg_pending is None:
+            self._cfg_pending = self.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        """Sync the canvas scrollregion, skipping no-op reconfigures.
+
+        The inner frame is the canvas's only item and sits at (0, 0), so
+        its requested size is the scrollregion; asking for it directly
+        avoids the per-item traversal bbox("all") does.
+        """
+        self._cfg_pending = None
+        region = (0, 0, self.scrollable_frame.winfo_reqwidth(),
+                  self.scrollable_frame.winfo_reqheight())
+        if region != self._last_scrollregion:
+            self._last_scrollregion = region
+            self.canvas.configure(scrollregion=region)
+
     def set_tool(self, tool_name):
         """Set the current tool and update configuration options"""
+        # Re-selecting the current tool (e.g. combobox focus churn) is a
+        # no-op; the right frame is already packed
+        if tool_name == self.current_tool:
+            return
         self.current_tool = tool_name
-        self.clear_config()
-        
-        if tool_name:
-            self.create_config_for_tool(tool_name)
-            
-    def clear_config(self):
-        """Clear all configuration widgets"""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.config_widgets.clear()
-        
-    def create_config_for_tool(self, tool_name):
-        """Create configuration widgets for a specific tool"""
-        row = 0
-        
-        if tool_name == 'nwsync write':
-            self.add_file_input("Storage Directory", "root", row, is_directory=True)
-            row += 1
-            self.add_file_input("Module/ERF Files", "specs", row, multiple=True)
-            row += 1
-            self.add_text_input("Name", "name", row)
-            row += 1
-            self.add_text_input("Description", "description", row)
-            row += 1
-            self.add_checkbox("Include Module Contents", "with_module", row)
-            row += 1
-            self.add_number_input("Group ID", "group_id", row, default=0)
-            
-        elif tool_name == 'nwsync print':
-            self.add_file_input("Manifest File", "manifest", row)
-            row += 1
-            self.add_checkbox("Verify Files", "verify", row)
-            
-        elif tool_name == 'erf pack':
-            self.add_file_input("Input Directory", "input_dir", row, is_directory=True)
-            row += 1
-            self.add_file_input("Output ERF", "output_erf", row, save=True)
-            
-        elif tool_name == 'erf unpack':
-            self.add_file_input("Input ERF", "input_erf", row)
-            row += 1
-            self.add_file_input("Output Directory", "output_dir", row, is_directory=True)
-            
-        elif tool_name == 'gff convert':
-            self.add_file_input("Input GFF File", "input", row)
-            row += 1
-            self.add_file_input("Output File", "output", row, save=True)
-            row += 1
-            self.add_checkbox("Convert to JSON", "to_json", row, default=True)
-            
-        elif tool_name == 'gff info':
-            self.add_file_input("Input GFF File", "input", row)
-            row += 1
-            self.add_checkbox("Verbose Output", "verbose", row)
-            
-        elif tool_name == 'tlk convert':
-            self.add_file_input("Input TLK File", "input", row)
-            row += 1
-            self.add_file_input("Output File (optional)", "output", row, save=True)
-            row += 1
-            self.add_checkbox("Convert to JSON", "to_json", row, default=True)
-            
-        elif tool_name == 'tlk info':
-            self.add_file_input("Input TLK File", "input", row)
-            row += 1
-            self.add_checkbox("Verbose Output", "verbose", row)
-            
-        elif tool_name == 'twoda convert':
-            self.add_file_input("Input 2DA File", "input", row)
-            row += 1
-            self.add_file_input("Output File", "output", row, save=True)
-            row += 1
-            self.add_checkbox("Convert to CSV", "to_csv", row)
-            row += 1
-            self.add_checkbox("Convert to JSON", "to_json", row)
-            row += 1
-            self.add_checkbox("Minify Output", "minify", row)
-            
-        elif tool_name == 'twoda info':
-            self.add_file_input("Input 2DA File", "input", row)
-            row += 1
-            self.add_checkbox("Verbose Output", "verbose", row)
-            
-        elif tool_name == 'key pack':
-            self.add_file_input("Input Directory", "input", row, is_directory=True)
-            row += 1
-            self.add_file_input("Output KEY File", "output", row, save=True)
-            
-        elif tool_name == 'key unpack':
-            self.add_file_input("Input KEY File", "input", row)
-            row += 1
-            self.add_file_input("Output Directory", "output", row, is_directory=True)
-            
-        elif tool_name == 'key list':
-            self.add_file_input("Input KEY File", "input", row)
-            
-        elif tool_name == 'key shadows':
-            self.add_file_input("Input KEY File", "input", row)
-            
-        elif tool_name == 'resman extract':
-            self.add_file_input("Output Directory", "output", row, is_directory=True)
-            row += 1
-            self.add_text_input("Pattern Filter", "pattern", row)
-            row += 1
-            self.add_text_input("Resource Type", "type", row)
-            
-        elif tool_name == 'resman cat':
-            self.add_text_input("Resource Name", "resource", row)
-            
-        elif tool_name == 'resman grep':
-            self.add_text_input("Search Pattern", "pattern", row)
-            row += 1
-            self.add_text_input("Resource Type", "type", row)
-            
-        elif tool_name == 'resman diff':
-            self.add_file_input("First Container", "first", row)
-            row += 1
-            self.add_file_input("Second Container", "second", row)
-            
-        elif tool_name == 'script compile':
-            self.add_file_input("Input NSS File", "input", row)
-            row += 1
-            self.add_file_input("Output NCS File", "output", row, save=True)
-            row += 1
-            self.add_file_input("Includes Directory", "includes", row, is_directory=True)
-            row += 1
-            self.add_checkbox("Verbose Output", "verbose", row)
-            row += 1
-            self.add_checkbox("Create Dummy Output (for testing)", "dummy", row)
-            
-        elif tool_name == 'script decompile':
-            self.add_file_input("Input NCS File", "input", row)
-            row += 1
-            self.add_file_input("Output NSS File", "output", row, save=True)
-            
-        elif tool_name == 'script disasm':
-            self.add_file_input("Input NCS File", "input", row)
-            
-        else:
-            # Fallback for unknown tools
+
+        if self._active_frame is not None:
+            self._active_frame.pack_forget()
+            self._active_frame = None
+        self.config_widgets = {}
+
+        if not tool_name:
+            return
+
+        cached = self._tool_frames.get(tool_name)
+        if cached is None:
+            cached = self._build_tool_frame(tool_name)
+            self._tool_frames[tool_name] = cached
+
+        frame, widgets = cached
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._active_frame = frame
+        self.config_widgets = widgets
+
+        builder = _ARGV_BUILDERS.get(tool_name)
+        if builder is None:
+            builder = _ARGV_BUILDERS[tool_name] = _make_argv_builder(tool_name)
+        self._build_argv = builder
+
+    def _build_tool_frame(self, tool_name):
+        """Build (once) the configuration frame for a tool from its schema"""
+        frame = ttk.Frame(self.scrollable_frame)
+        # Column weight is a per-frame property; set it once here rather
+        # than once per file input
+        frame.grid_columnconfigure(1, weight=1)
+        widgets = {}
+        self._build_frame = frame
+        self._build_widgets = widgets
+
+        schema = _TOOL_SCHEMAS.get(tool_name)
+        if schema is None:
+            # Fallback for tools without a configuration form yet
             ttk.Label(
-                self.scrollable_frame,
+                frame,
                 text=f"✅ {tool_name} command is available.\nConfiguration panel will be added in future updates."
-            ).grid(row=row, column=0, columnspan=3, pady=10)
-            
+            ).grid(row=0, column=0, columnspan=3, pady=10)
+        else:
+            adders = {
+                'file': self.add_file_input,
+                'text': self.add_text_input,
+                'number': self.add_number_input,
+                'check': self.add_checkbox,
+            }
+            for row, (kind, label, key, kwargs) in enumerate(schema):
+                adders[kind](label, key, row, **kwargs)
+
+        return frame, widgets
+
     def add_file_input(self, label, key, row, is_directory=False, save=False, multiple=False):
         """Add a file input widget"""
-        ttk.Label(self.scrollable_frame, text=f"{label}:").grid(
+        ttk.Label(self._build_frame, text=f"{label}:").grid(
             row=row, column=0, sticky=tk.W, padx=(0, 10), pady=2
         )
-        
-        var = tk.StringVar()
-        entry = ttk.Entry(self.scrollable_frame, textvariable=var, width=40)
+
+        entry = ttk.Entry(self._build_frame, width=40)
         entry.grid(row=row, column=1, sticky=tk.EW, pady=2)
-        
+
+        # Re-entrance guard: a double-click on Browse must not stack a
+        # second modal dialog on top of the first
+        busy = [False]
+
         def browse():
-            if is_directory:
-                path = filedialog.askdirectory()
-            elif save:
-                path = filedialog.asksaveasfilename()
-            elif multiple:
-                path = filedialog.askopenfilenames()
-                if path:
-                    path = ';'.join(path)  # Join multiple files
-            else:
-                path = filedialog.askopenfilename()
-            
+            if busy[0]:
+                return
+            busy[0] = True
+            initialdir = self._last_dir.get(key) or os.path.expanduser('~')
+            try:
+                if is_directory:
+                    path = filedialog.askdirectory(initialdir=initialdir)
+                    if path:
+                        self._last_dir[key] = path
+                elif save:
+                    path = filedialog.asksaveasfilename(initialdir=initialdir)
+                    if path:
+                        self._last_dir[key] = os.path.dirname(path)
+                elif multiple:
+                    paths = filedialog.askopenfilenames(initialdir=initialdir)
+                    if not paths:
+                        return
+                    # Keep the real list; the joined string is display
+                    # only. Paths containing ';' survive this way.
+                    entry.selected_paths = list(paths)
+                    self._last_dir[key] = os.path.dirname(paths[0])
+                    path = ';'.join(paths)
+                else:
+                    path = filedialog.askopenfilename(initialdir=initialdir)
+                    if path:
+                        self._last_dir[key] = os.path.dirname(path)
+            finally:
+                busy[0] = False
+
             if path:
-                var.set(path)
-                
-        browse_btn = ttk.Button(self.scrollable_frame, text="Browse...", command=browse)
+                entry.delete(0, tk.END)
+                entry.insert(0, path)
+
+        browse_btn = ttk.Button(self._build_frame, text="Browse...", command=browse)
         browse_btn.grid(row=row, column=2, padx=(5, 0), pady=2)
-        
-        self.config_widgets[key] = var
-        self.scrollable_frame.grid_columnconfigure(1, weight=1)
-        
+
+        self._build_widgets[key] = ('entry', entry)
+
     def add_text_input(self, label, key, row, default=""):
         """Add a text input widget"""
-        ttk.Label(self.scrollable_frame, text=f"{label}:").grid(
+        ttk.Label(self._build_frame, text=f"{label}:").grid(
             row=row, column=0, sticky=tk.W, padx=(0, 10), pady=2
         )
-        
-        var = tk.StringVar(value=default)
-        entry = ttk.Entry(self.scrollable_frame, textvariable=var, width=40)
+
+        entry = ttk.Entry(self._build_frame, width=40)
+        if default:
+            entry.insert(0, default)
         entry.grid(row=row, column=1, columnspan=2, sticky=tk.EW, pady=2)
-        
-        self.config_widgets[key] = var
-        
+
+        self._build_widgets[key] = ('entry', entry)
+
     def add_number_input(self, label, key, row, default=0):
         """Add a number input widget"""
-        ttk.Label(self.scrollable_frame, text=f"{label}:").grid(
+        ttk.Label(self._build_frame, text=f"{label}:").grid(
             row=row, column=0, sticky=tk.W, padx=(0, 10), pady=2
         )
-        
-        var = tk.StringVar(value=str(default))
-        entry = ttk.Entry(self.scrollable_frame, textvariable=var, width=20)
+
+        entry = ttk.Entry(self._build_frame, width=20)
+        entry.insert(0, str(default))
         entry.grid(row=row, column=1, sticky=tk.W, pady=2)
-        
-        self.config_widgets[key] = var
-        
+
+        self._build_widgets[key] = ('entry', entry)
+
     def add_checkbox(self, label, key, row, default=False):
         """Add a checkbox widget"""
+        # The one place a Tcl variable is still needed: defaults and
+        # toggling go through it. Kept alive on the widget; state is read
+        # back via instate() at run time.
         var = tk.BooleanVar(value=default)
-        checkbox = ttk.Checkbutton(self.scrollable_frame, text=label, variable=var)
+        checkbox = ttk.Checkbutton(self._build_frame, text=label, variable=var)
+        checkbox.variable = var
         checkbox.grid(row=row, column=0, columnspan=3, sticky=tk.W, pady=2)
-        
-        self.config_widgets[key] = var
-        
+
+        self._build_widgets[key] = ('check', checkbox)
+
     def run_command(self):
         """Build and execute the command"""
         if not self.current_tool:
@@ -404,94 +617,33 @@ class ConfigPanel(ttk.LabelFrame):
             return
 
         try:
-            # Split the tool into verb and subcommand, e.g. "tlk convert" -> ["tlk", "convert"]
-            tool_parts = self.current_tool.split()
-            args = tool_parts[:]  # Start with the tool command parts
-
-            # Helper to push a named flag with value: --flag value
-            def push_flag(flag_key: str, value: str):
-                args.append(f"--{flag_key.replace('_', '-')}")
-                args.append(value)
-
-            positional_queue = []
-            flag_queue = []
-
-            for key, var in self.config_widgets.items():
+            # Read current values, then hand them to the argv builder
+            # baked for this tool by set_tool
+            values = {}
+            for key, (kind, widget) in self.config_widgets.items():
                 try:
-                    value = var.get()
-                    if isinstance(var, tk.BooleanVar):
-                        if value:
-                            flag_queue.append((key, True))
-                    elif value:
-                        if key == "specs":
-                            if ';' in value:
-                                for v in value.split(';'):
-                                    positional_queue.append(v)
-                            else:
-                                positional_queue.append(value)
-                        elif key in [
-                            'root', 'manifest',
-                            'input_dir', 'input_erf',
-                            'output_dir', 'output_erf',
-                            'input', 'output',
-                            'first', 'second',
-                            'resource', 'pattern'
-                        ]:
-                            positional_queue.append(value)
-                        else:
-                            flag_queue.append((key, value))
+                    if kind == 'check':
+                        values[key] = widget.instate(['selected'])
+                    else:
+                        value = widget.get()
+                        # Prefer the dialog's real path list while the
+                        # entry still shows it verbatim; hand edits fall
+                        # back to the displayed string
+                        paths = getattr(widget, 'selected_paths', None)
+                        if paths is not None and value == ';'.join(paths):
+                            value = paths
+                        values[key] = value
                 except Exception as e:
                     messagebox.showerror("Error", f"Error getting value for {key}: {str(e)}")
                     return
 
-            # Special handling and validation for tlk convert
-            if tool_parts == ["tlk", "convert"] or tool_parts == ["tlk"]:
-                # Default subcommand if missing
-                if tool_parts == ["tlk"]:
-                    tool_parts = ["tlk", "convert"]
-                # Extract expected operands
-                input_path = None
-                output_path = None
-                rest_positionals = []
-
-                for v in positional_queue:
-                    if input_path is None:
-                        input_path = v
-                    elif output_path is None:
-                        output_path = v
-                    else:
-                        rest_positionals.append(v)
-
-                # If no input chosen, prompt the user instead of crashing
-                if not input_path:
-                    messagebox.showwarning("Missing input", "Please choose an Input TLK File.")
-                    return
-
-                args = tool_parts[:]
-                args.append(input_path)
-
-                # Output is optional; add only if provided
-                if output_path:
-                    args.extend(["-o", output_path])
-
-                # No extra positionals expected; append none
-                # Add flags
-                for k, v in flag_queue:
-                    if v is True:
-                        args.append(f"--{k.replace('_', '-')}")
-                    else:
-                        push_flag(k, v)
-            else:
-                # Default behavior for other tools: positionals then flags
-                args = tool_parts[:] + positional_queue
-                for k, v in flag_queue:
-                    if v is True:
-                        args.append(f"--{k.replace('_', '-')}")
-                    else:
-                        push_flag(k, v)
+            args = self._build_argv(values)
+            if args is None:
+                messagebox.showwarning("Missing input", "Please choose an Input TLK File.")
+                return
 
             # Ensure we have at least something beyond tool parts
-            if len(args) <= len(tool_parts):
+            if len(args) <= len(self.current_tool.split()):
                 messagebox.showwarning("Warning", "No arguments specified. Please configure the command options.")
                 return
 
@@ -510,90 +662,92 @@ class ConfigPanel(ttk.LabelFrame):
 
         # Display concise, built-in help text to avoid subprocess errors in GUI
         tool = self.current_tool
-        help_map = {
-            "tlk convert": "tlk convert INPUT [-o OUTPUT] [--to-json]",
-            "tlk info": "tlk info INPUT [--verbose]",
-            "gff convert": "gff convert INPUT [-o OUTPUT] [--to-json]",
-            "gff info": "gff info INPUT [-v|--verbose]",
-            "twoda convert": "twoda convert INPUT [-o OUTPUT] [--to-csv] [--to-json] [--minify]",
-            "twoda info": "twoda info INPUT [--verbose]",
-            "erf pack": "erf pack INPUT_DIR [-o OUTPUT.erf]",
-            "erf unpack": "erf unpack INPUT.erf [-o OUTPUT_DIR]",
-            "key pack": "key pack INPUT_DIR [-o OUTPUT.key]",
-            "key unpack": "key unpack INPUT.key [-o OUTPUT_DIR]",
-            "key list": "key list INPUT.key",
-            "key shadows": "key shadows INPUT.key",
-            "resman extract": "resman extract [-o DIR] [-p PATTERN] [--type TYPE]",
-            "resman grep": "resman grep PATTERN [--type TYPE]",
-            "resman cat": "resman cat NAME.ext",
-            "resman stats": "resman stats",
-            "resman diff": "resman diff FIRST_DIR SECOND_DIR",
-            "script compile": "script compile INPUT.nss [-o OUTPUT.ncs] [-i INCLUDES] [--dummy] [-v]",
-            "script decompile": "script decompile INPUT.ncs [-o OUTPUT.nss]",
-            "script disasm": "script disasm INPUT.ncs",
-            "nwsync write": "nwsync-write ROOT SPEC... [--name NAME] [--description TEXT] [--group-id ID] [--limit-file-size MB] [--with-module] [--dry-run]",
-            "nwsync print": "nwsync-print MANIFEST [--verify] [-r REPO_ROOT]",
-        }
-        text = help_map.get(tool, f"No inline help available for: {tool}")
+        text = _HELP_MAP.get(tool, f"No inline help available for: {tool}")
         self.show_help_dialog(text)
 
     def show_help_dialog(self, help_text):
-        """Show help text in a scrollable dialog"""
-        import tkinter as tk
-        
-        help_window = tk.Toplevel(self)
-        help_window.title(f"Help - {self.current_tool}")
-        help_window.geometry("600x400")
-        
-        # Create text widget with scrollbar
-        text_frame = ttk.Frame(help_window)
-        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        text_widget = tk.Text(text_frame, wrap=tk.WORD, font=("Consolas", 10))
-        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Insert help text
-        text_widget.insert(tk.END, help_text)
-        text_widget.config(state=tk.DISABLED)
-        
-        # Close button
-        close_btn = ttk.Button(help_window, text="Close", command=help_window.destroy)
-        close_btn.pack(pady=5)
+        """Show help text in a scrollable dialog.
+
+        The Toplevel and its widgets are built once; later calls just
+        swap the text and deiconify, and closing only withdraws the
+        window, so help clicks stop allocating widgets.
+        """
+        if self._help_window is None:
+            help_window = tk.Toplevel(self)
+            help_window.geometry("600x400")
+            help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+
+            # Create text widget with scrollbar
+            text_frame = ttk.Frame(help_window)
+            text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+            text_widget = tk.Text(text_frame, wrap=tk.WORD, font=("Consolas", 10))
+            scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
+            text_widget.configure(yscrollcommand=scrollbar.set)
+
+            text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+            # Close button
+            close_btn = ttk.Button(help_window, text="Close", command=help_window.withdraw)
+            close_btn.pack(pady=5)
+
+            self._help_window = help_window
+            self._help_text = text_widget
+
+        self._help_window.title(f"Help - {self.current_tool}")
+        self._help_text.config(state=tk.NORMAL)
+        self._help_text.delete('1.0', tk.END)
+        self._help_text.insert(tk.END, help_text)
+        self._help_text.config(state=tk.DISABLED)
+        self._help_window.deiconify()
+        self._help_window.lift()
 
 
 class OutputPanel(ttk.LabelFrame):
     """Widget for displaying command output"""
-    
+
+    # Soft cap on buffered lines; insert and layout cost grow with total
+    # text, so long runs trim the oldest lines back to _TRIM_TO
+    _MAX_LINES = 5000
+    _TRIM_TO = 4000
+
     def __init__(self, parent):
         super().__init__(parent, text="Output", padding=10)
-        
+
+        # Appends are buffered and flushed once per timer tick so a chatty
+        # command costs one insert/relayout per frame, not one per line
+        self._pending = []
+        self._flush_scheduled = False
+
         self.setup_ui()
         
     def setup_ui(self):
         """Setup the output UI"""
-        # Text widget with scrollbar
+        # Text widget with scrollbars
+        # Output-only: created disabled with the undo stack off, so
+        # inserts skip undo bookkeeping and stray keypresses can't edit
+        # the log. Writers toggle state around their inserts; mouse
+        # selection and copying still work on a disabled Text.
+        # wrap=NONE keeps inserts cheap: word wrapping re-layouts every
+        # long line on insert and resize, which dominates for log-sized
+        # output; long lines scroll horizontally instead.
         self.text_widget = tk.Text(
             self,
-            wrap=tk.WORD,
+            wrap=tk.NONE,
             font=("Consolas", 10),
             bg="black",
-            fg="white"
+            fg="white",
+            state=tk.DISABLED,
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
-        
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.text_widget.yview)
-        self.text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        self.text_widget.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Button frame
+
+        # Button frame (packed first so it keeps the bottom edge)
         button_frame = ttk.Frame(self)
-        button_frame.pack(fill=tk.X, pady=(10, 0))
-        
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
+
         # Clear button
         clear_btn = ttk.Button(button_frame, text="Clear", command=self.clear)
         clear_btn.pack(side=tk.RIGHT)
@@ -601,18 +755,52 @@ class OutputPanel(ttk.LabelFrame):
         # Copy All button
         copy_btn = ttk.Button(button_frame, text="Copy All", command=self.copy_all)
         copy_btn.pack(side=tk.RIGHT, padx=(0, 5))
+
+        xscrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.text_widget.xview)
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.text_widget.yview)
+        self.text_widget.configure(yscrollcommand=scrollbar.set,
+                                   xscrollcommand=xscrollbar.set)
+
+        xscrollbar.pack(side="bottom", fill="x")
+        self.text_widget.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
         
     def append_text(self, text):
-        """Append text to the output"""
-        self.text_widget.insert(tk.END, text)
-        self.text_widget.see(tk.END)  # Scroll to bottom
-        
+        """Append text to the output (batched; flushed on a short timer)"""
+        self._pending.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.text_widget.after(16, self._flush)
+
+    def _flush(self):
+        """Insert all buffered text in one call"""
+        chunk = ''.join(self._pending)
+        self._pending.clear()
+        self._flush_scheduled = False
+
+        # Only chase the end if the user was already at the bottom, so
+        # scrolling back to read earlier output is not fought by new lines
+        at_bottom = self.text_widget.yview()[1] > 0.98
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.insert(tk.END, chunk)
+
+        last = int(self.text_widget.index('end-1c').split('.')[0])
+        if last > self._MAX_LINES:
+            self.text_widget.delete('1.0', f'{last - self._TRIM_TO}.0')
+        self.text_widget.config(state=tk.DISABLED)
+
+        if at_bottom:
+            self.text_widget.see(tk.END)
+
     def clear(self):
         """Clear the output"""
+        self._pending.clear()
+        self.text_widget.config(state=tk.NORMAL)
         self.text_widget.delete(1.0, tk.END)
+        self.text_widget.config(state=tk.DISABLED)
 
     def copy_all(self):
-        """Copy all output to clipboard"""
-        content = self.text_widget.get(1.0, tk.END)
+        """Copy the visible output buffer (at most the last _MAX_LINES
+        lines; older output is trimmed) to the clipboard"""
         self.text_widget.clipboard_clear()
-        self.text_widget.clipboard_append(content)
+        self.text_widget.clipboard_append(self.text_widget.get('1.0', 'end-1c'))
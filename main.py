@@ -5,15 +5,71 @@ Main entry point for CLI and GUI applications
 """
 
 import sys
-import argparse
 from pathlib import Path
 
 # Add the package to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core import __version__
-from cli.main import main as cli_main
-from gui.main import main as gui_main
+
+def _run_cli(argv):
+    # Imported here so GUI-less CLI startup never pays the Tk import and
+    # vice versa; both subsystems pull in the core format modules
+    from cli.main import main as cli_main
+    # Pass remaining args to CLI (skip 'cli' argument)
+    sys.argv = [argv[0]] + argv[2:]
+    return cli_main()
+
+
+def _run_gui(argv):
+    from gui.main import main as gui_main
+    return gui_main()
+
+
+_HELP = """\
+NeverWinter Python Tools - CLI and GUI for NWN file formats
+
+Usage:
+  nwpy cli [command] [args...]    Run CLI interface
+  nwpy gui                        Run GUI interface
+
+CLI Commands:
+  erf pack/unpack   ✅ ERF archive operations
+  gff convert/info  ✅ GFF file operations
+  nwsync write/print ✅ NWSync operations
+  tlk convert/info  ✅ TLK (Talk Table) operations
+  twoda convert/info ✅ 2DA operations (includes --minify)
+  key pack/unpack/list ✅ KEY file operations
+  resman extract/stats/grep ✅ Resource manager operations
+  script compile/decompile ✅ NWScript operations
+
+Use 'nwpy cli --help' for full command list
+"""
+
+
+def _print_help(argv):
+    sys.stdout.write(_HELP)
+    return 0
+
+
+def _print_version(argv):
+    from core import __version__
+    print(f"NWPY {__version__}")
+    return 0
+
+
+def _unknown_mode(argv):
+    print(f"Unknown mode: {argv[1]}")
+    print("Use 'nwpy --help' for usage information")
+    return 1
+
+
+_DISPATCH = {
+    "cli": _run_cli,
+    "gui": _run_gui,
+    "--help": _print_help,
+    "-h": _print_help,
+    "--version": _print_version,
+}
 
 
 def main():
@@ -21,41 +77,8 @@ def main():
     if len(sys.argv) < 2:
         print("Usage: nwpy {cli|gui} [args...]")
         return 1
-    
-    mode = sys.argv[1]
-    
-    if mode == "cli":
-        # Pass remaining args to CLI (skip 'cli' argument)
-        sys.argv = [sys.argv[0]] + sys.argv[2:]
-        return cli_main()
-    elif mode == "gui":
-        return gui_main()
-    elif mode in ["--help", "-h"]:
-        print("NeverWinter Python Tools - CLI and GUI for NWN file formats")
-        print("")
-        print("Usage:")
-        print("  nwpy cli [command] [args...]    Run CLI interface")
-        print("  nwpy gui                        Run GUI interface")
-        print("")
-        print("CLI Commands:")
-        print("  erf pack/unpack   ✅ ERF archive operations")
-        print("  gff convert/info  ✅ GFF file operations")
-        print("  nwsync write/print ✅ NWSync operations")
-        print("  tlk convert/info  ✅ TLK (Talk Table) operations")
-        print("  twoda convert/info ✅ 2DA operations (includes --minify)")
-        print("  key pack/unpack/list ✅ KEY file operations")
-        print("  resman extract/stats/grep ✅ Resource manager operations")
-        print("  script compile/decompile ✅ NWScript operations")
-        print("")
-        print("Use 'nwpy cli --help' for full command list")
-        return 0
-    elif mode == "--version":
-        print(f"NWPY {__version__}")
-        return 0
-    else:
-        print(f"Unknown mode: {mode}")
-        print("Use 'nwpy --help' for usage information")
-        return 1
+
+    return _DISPATCH.get(sys.argv[1], _unknown_mode)(sys.argv)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 Setup script for NeverWinter Python Tools
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read README
@@ -24,7 +24,15 @@ setup(
     author_email="nwpy@example.com",
     url="https://github.com/example/nwpy",
     
-    packages=find_packages(),
+    # Static package list; the layout is small and stable, so skip the
+    # source-tree walk find_packages() does on every install
+    packages=[
+        'core',
+        'core.formats',
+        'cli',
+        'cli.commands',
+        'gui',
+    ],
     python_requires=">=3.7",
     
     install_requires=[
@@ -36,17 +44,25 @@ setup(
         'crypto': ['cryptography>=3.0.0'],
         'imaging': ['Pillow>=8.0.0'],
         'xml': ['lxml>=4.6.0'],
+        'perf': ['orjson>=3.0.0', 'xxhash>=3.0.0'],
         'all': [
             'requests>=2.25.0',
-            'cryptography>=3.0.0', 
+            'cryptography>=3.0.0',
             'Pillow>=8.0.0',
-            'lxml>=4.6.0'
+            'lxml>=4.6.0',
+            'orjson>=3.0.0',
+            'xxhash>=3.0.0'
         ]
     },
     
     entry_points={
         'console_scripts': [
             'nwpy=main:main',
+            # Direct entry points that skip mode dispatch entirely:
+            # nwpy-cli never touches tkinter, nwpy-gui never builds the
+            # argparse tree
+            'nwpy-cli=cli.main:main',
+            'nwpy-gui=gui.main:main',
         ],
     },
     